@@ -11,7 +11,7 @@ logging.basicConfig(level=logging.DEBUG)
 
 # Create an interface instance for communication with the microcontroller.
 # Here, we are using a serial interface with specified port and baud-rate.
-interface = InterfaceFactory.get_interface(IType.SERIAL, port="COM16", baudrate=115200)
+interface = InterfaceFactory.get_interface(IType.SERIAL, port="COM16", baud_rate=115200)
 
 # LNet is responsible for managing low-level communication with the microcontroller.
 l_net = LNet(interface)
@@ -25,10 +25,10 @@ logging.debug(f"appversion:{l_net.device_info.appVer}....... DSP state:{l_net.de
 # Reading a specific memory address from the RAM of the microcontroller.
 # here we provide manually the address and the data type of the variable.
 read_bytes = l_net.get_ram(4148, 2)
+logging.debug(read_bytes)
 
-# Convert the read bytes to an integer for easier interpretation.
-# The byte order is specified as 'little-endian'.
-logging.debug(int.from_bytes(read_bytes, byteorder="little"))
+# The same variable can be read directly as an (unsigned, little-endian) integer.
+logging.debug(l_net.get_ram_int(4148, 2))
 
 # The following code is commented out. If executed, it would write a value to a specific memory address.
 # put_value = l_net.put_ram(4148, 2, bytes(50))
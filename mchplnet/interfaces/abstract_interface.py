@@ -24,6 +24,9 @@ class InterfaceABC(ABC):
         read():
             Read data from the interface. Subclasses should implement this method.
 
+        transact(data) -> bytearray:
+            Write a request frame and read its response. Subclasses may override this method.
+
         start():
             Start the interface. Subclasses should implement this method.
 
@@ -104,6 +107,21 @@ class InterfaceABC(ABC):
         """
         pass
 
+    def transact(self, data: bytearray) -> bytearray:
+        """Write a request frame to the interface and read the response frame.
+
+        The default implementation calls write() followed by read(). Interfaces that can
+        exchange a frame more efficiently in one step should override this method.
+
+        Args:
+            data: The request frame to be written to the interface.
+
+        Returns:
+            A bytearray with the response frame or None.
+        """
+        self.write(data)
+        return self.read()
+
     @abstractmethod
     def start(self):
         """Starts the interface.
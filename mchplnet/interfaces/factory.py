@@ -3,59 +3,46 @@
 Usage: Ensures the proper configuration of the communication interface supported by X2Cscope.
 """
 
+import importlib
 import logging
-from enum import Enum
+from enum import IntEnum
+from typing import Dict, FrozenSet, Tuple
 
 from mchplnet.interfaces.abstract_interface import InterfaceABC
-from mchplnet.interfaces.can import LNetCan
-from mchplnet.interfaces.lin import LNetLin
-from mchplnet.interfaces.tcp_ip import LNetTcpIp
-from mchplnet.interfaces.uart import LNetSerial
 
 
-class InterfaceType(Enum):
+class InterfaceType(IntEnum):
     SERIAL = 1
     CAN = 2
     LIN = 3
     TCP_IP = 4
 
 
+# module, class name and required parameters of each interface
+# modules are imported on first use, so e.g. pyserial is only loaded when a serial interface is requested
+_INTERFACE_REGISTRY: Dict[InterfaceType, Tuple[str, str, FrozenSet[str]]] = {
+    InterfaceType.SERIAL: ("mchplnet.interfaces.uart", "LNetSerial", frozenset({"port"})),
+    InterfaceType.CAN: ("mchplnet.interfaces.can", "LNetCan", frozenset({"channel"})),
+    InterfaceType.LIN: ("mchplnet.interfaces.lin", "LNetLin", frozenset({"channel"})),
+    InterfaceType.TCP_IP: ("mchplnet.interfaces.tcp_ip", "LNetTcpIp", frozenset({"host", "port"})),
+}
+
+
 class InterfaceFactory:
     @staticmethod
     def get_interface(interface_type: InterfaceType, *args: object, **kwargs: object) -> InterfaceABC:
-        interfaces = {
-            InterfaceType.SERIAL: (
-                LNetSerial,
-                {
-                    "port": "Serial port name or device path",
-                },
-            ),
-            InterfaceType.CAN: (
-                LNetCan,
-                {"channel": "CAN channel number or identifier"},
-            ),
-            InterfaceType.LIN: (
-                LNetLin,
-                {"channel": "LIN channel number or identifier"},
-            ),
-            InterfaceType.TCP_IP: (
-                LNetTcpIp,
-                {
-                    "host": "IP address or hostname of the remote device",
-                    "port": "Port number for TCP/IP communication",
-                },
-            ),
-        }
-
-        interface_class, required_params = interfaces[interface_type]
+        module_name, class_name, required_params = _INTERFACE_REGISTRY[interface_type]
 
         # TODO: required params should be a task of the interface, an not of the factory
         # if the parameter is not supplied, it should assume default values
         # Check if all required parameters are provided
-        missing_params = [param for param, description in required_params.items() if param not in kwargs]
+        missing_params = required_params - kwargs.keys()
         if missing_params:
-            raise ValueError(f"Missing required parameters for {interface_type.name}: {', '.join(missing_params)}")
+            raise ValueError(
+                f"Missing required parameters for {interface_type.name}: {', '.join(sorted(missing_params))}"
+            )
 
+        interface_class = getattr(importlib.import_module(module_name), class_name)
         return interface_class(*args, **kwargs)
 
 
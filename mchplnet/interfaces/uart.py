@@ -4,6 +4,8 @@ import serial
 
 from mchplnet.interfaces.abstract_interface import InterfaceABC
 
+logger = logging.getLogger(__name__)
+
 
 class LNetSerial(InterfaceABC):
     """A class representing a serial communication interface for the LNet framework.
@@ -37,6 +39,9 @@ class LNetSerial(InterfaceABC):
         read() -> list:
             Read data from the serial port.
 
+        transact(data) -> bytearray:
+            Discard stale input, write a request frame and read its response.
+
     Raises:
         ValueError: If the provided serial settings are invalid.
     """
@@ -119,7 +124,7 @@ class LNetSerial(InterfaceABC):
                 timeout=1,
             )
         except Exception as e:
-            logging.debug(e)
+            logger.debug(e)
 
     def stop(self):
         """Close the serial communication.
@@ -149,6 +154,20 @@ class LNetSerial(InterfaceABC):
         else:
             return
 
+    def transact(self, data):
+        """Discard any stale input, write a request frame and read its response.
+
+        Args:
+            data: The request frame to be written to the serial port.
+
+        Returns:
+            bytearray: The response frame read from the serial port.
+        """
+        if self.serial:
+            self.serial.reset_input_buffer()
+            self.serial.write(data)
+        return self.read()
+
     def is_open(self) -> bool:
         """Check if the serial port is open and operational.
 
@@ -161,18 +180,41 @@ class LNetSerial(InterfaceABC):
         return self.serial.is_open
 
     def read(self):
-        response_list = bytearray()
+        """Read a complete LNet frame from the serial port.
+
+        The frame is read in as few calls as possible: the header first, then everything the SIZE byte
+        announces, topped up with any fill bytes found in the data already received. The read returns as
+        soon as the last byte of the frame arrives instead of waiting byte by byte.
+
+        Returns:
+            bytearray: The frame read from the serial port (empty or incomplete on timeout).
+        """
+        response = bytearray()
         if self.serial:
-            counter = 0
-            read_size = 4
-            while counter < read_size:
-                byte = ord(self.serial.read())
-                response_list.append(byte)
-                counter += 1
-                if counter == 1:
-                    pass
-                elif counter == 3:
-                    read_size = response_list[1] + read_size
-                elif byte == 0x55 or byte == 0x02:
-                    read_size += 1
-        return response_list
+            read_size = 3  # SYN, SIZE and NODE
+            while len(response) < read_size:
+                chunk = self.serial.read(read_size - len(response))
+                if not chunk:
+                    logger.debug("Timeout while reading frame: %r", response)
+                    break
+                response += chunk
+                read_size = self._frame_size(response)
+        return response
+
+    @staticmethod
+    def _frame_size(frame: bytearray) -> int:
+        """Compute the number of bytes a partially received frame is known to span.
+
+        Args:
+            frame (bytearray): The bytes received so far, starting with SYN.
+
+        Returns:
+            int: Frame size in bytes including the fill bytes seen so far.
+        """
+        if len(frame) < 2:
+            return 3
+        # SYN, SIZE, NODE and CRC surround the data area announced by SIZE
+        size = frame[1] + 4
+        # every reserved key value after SYN is followed by a 0x00 fill byte
+        fill_bytes = frame.count(0x55, 1) + frame.count(0x02, 1)
+        return size + fill_bytes
@@ -1,4 +1,5 @@
 import logging
+from typing import List, Optional, Tuple
 
 from mchplnet.interfaces.abstract_interface import InterfaceABC
 from mchplnet.services.frame_device_info import DeviceInfo, FrameDeviceInfo
@@ -8,6 +9,15 @@ from mchplnet.services.frame_putram import FramePutRam
 from mchplnet.services.frame_save_parameter import FrameSaveParameter, ScopeSetup
 from mchplnet.services.frame_reboot import FrameReboot
 
+logger = logging.getLogger(__name__)
+
+# Request frames without arguments are constant, serialize them only once
+_DEVICE_INFO_REQUEST = bytes(FrameDeviceInfo().serialize())
+_LOAD_PARAM_REQUEST = bytes(FrameLoadParameter().serialize())
+
+# Largest GetRam payload fitting in one frame: the frame size byte also counts service id and error id
+_MAX_READ_SIZE = 253
+
 
 class LNet:
     """LNet is a class that handles communication with a microcontroller.
@@ -16,6 +26,8 @@ class LNet:
     and reading/writing data to the microcontroller's RAM.
     """
 
+    __slots__ = ("interface", "device_info", "scope_data", "scope_setup", "_get_ram_frame", "_put_ram_frame")
+
     def __init__(self, interface: InterfaceABC, handshake: bool = True):
         """Initialize the LNet instance.
 
@@ -27,6 +39,8 @@ class LNet:
         self.interface = interface
         self.device_info = None
         self.scope_setup = ScopeSetup()
+        self._get_ram_frame = None
+        self._put_ram_frame = None
         if handshake:
             self._handshake()
 
@@ -40,7 +54,7 @@ class LNet:
             self.get_device_info()
             self.load_parameters()
         except Exception as e:
-            logging.error(e)
+            logger.error(e)
             raise RuntimeError("Failed to retrieve device information.")
 
     def get_device_info(self) -> DeviceInfo:
@@ -51,8 +65,11 @@ class LNet:
         """
         if not self.device_info:
             device_info_frame = FrameDeviceInfo()
-            device_info_frame.received = self._read_data(device_info_frame.serialize())
+            device_info_frame.received = self._read_data(_DEVICE_INFO_REQUEST)
             self.device_info = device_info_frame.deserialize()
+            # the pooled RAM frames are packed for the previous microcontroller width
+            self._get_ram_frame = None
+            self._put_ram_frame = None
         return self.device_info
 
 
@@ -65,8 +82,10 @@ class LNet:
         """
         self._check_device_info()
         reboot_device = FrameReboot()
-        print(reboot_device.serialize())
-        reboot_device.received = self._read_data(reboot_device.serialize())
+        request = reboot_device.serialize()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Reboot request: %r", request)
+        reboot_device.received = self._read_data(request)
         return reboot_device.received
 
     def _check_device_info(self):
@@ -104,7 +123,7 @@ class LNet:
         """
         self._check_device_info()
         frame_load_param = FrameLoadParameter()
-        frame_load_param.received = self._read_data(frame_load_param.serialize())
+        frame_load_param.received = self._read_data(_LOAD_PARAM_REQUEST)
         self.scope_data = frame_load_param.deserialize()
         return self.scope_data
 
@@ -122,8 +141,7 @@ class LNet:
         Raises:
             RuntimeError: If device information is not retrieved before reading RAM.
         """
-        self._check_device_info()
-        get_ram_frame = FrameGetRam(address, bytes_to_read, data_type, self.device_info.uc_width)
+        get_ram_frame = self._get_get_ram_frame(address, bytes_to_read, data_type)
         get_ram_frame.received = self._read_data(get_ram_frame.serialize())
         return get_ram_frame.deserialize()
 
@@ -140,11 +158,79 @@ class LNet:
         Raises:
             RuntimeError: If device information is not retrieved before reading RAM.
         """
-        self._check_device_info()
-        get_ram_frame = FrameGetRam(address, data_type, data_type, self.device_info.uc_width)
+        get_ram_frame = self._get_get_ram_frame(address, data_type, data_type)
         get_ram_frame.received = self._read_data(get_ram_frame.serialize())
         return get_ram_frame.deserialize()
 
+    def get_ram_int(self, address: int, data_type: int) -> Optional[int]:
+        """Read a variable from the microcontroller's RAM and return it as integer.
+
+        Args:
+            address (int): The address to read data from in the microcontroller's RAM.
+            data_type (int): The data type (number of bytes) to read.
+
+        Returns:
+            Optional[int]: The variable value as little-endian unsigned integer or None if the device answered
+            with an error.
+
+        Raises:
+            RuntimeError: If device information is not retrieved before reading RAM.
+        """
+        get_ram_frame = self._get_get_ram_frame(address, data_type, data_type)
+        get_ram_frame.received = self._read_data(get_ram_frame.serialize())
+        return get_ram_frame.deserialize_int()
+
+    def get_ram_batch(self, requests: List[Tuple[int, int]]) -> List[Optional[bytearray]]:
+        """Read several variables from the microcontroller's RAM, merging contiguous ones into block reads.
+
+        Requests whose address ranges touch or overlap are read together with a single GetRam request
+        of up to 253 bytes, or less if the target reports a smaller maximum frame size, and split afterwards,
+        saving one request/response exchange per merged variable. Gaps between variables are never read, but
+        merged variables are read byte-wise as one block, so use get_ram for registers that require a specific
+        access width. If the device rejects a merged block, its variables are read one by one with get_ram.
+
+        Args:
+            requests (List[Tuple[int, int]]): Pairs of address and data type (number of bytes) to read.
+
+        Returns:
+            List[Optional[bytearray]]: The data read from the RAM, in the same order as the requests.
+            Entries are None for requests the device answered with an error.
+
+        Raises:
+            RuntimeError: If device information is not retrieved before reading RAM.
+        """
+        self._check_device_info()
+        max_read_size = _MAX_READ_SIZE
+        # the maximum target frame size limits the DATA area, which also holds service id and error id
+        if self.device_info.maxTargetSize > 2:
+            max_read_size = min(max_read_size, self.device_info.maxTargetSize - 2)
+
+        # blocks of [start address, end address, request indices], built in address order
+        blocks = []
+        for index in sorted(range(len(requests)), key=lambda i: requests[i][0]):
+            address, size = requests[index]
+            if blocks:
+                block = blocks[-1]
+                end = max(block[1], address + size)
+                if address <= block[1] and end - block[0] <= max_read_size:
+                    block[1] = end
+                    block[2].append(index)
+                    continue
+            blocks.append([address, address + size, [index]])
+
+        results = [None] * len(requests)
+        for start, end, indices in blocks:
+            data = self.get_ram_array(start, end - start, 1) if len(indices) > 1 else None
+            if data is None:
+                # single variable, or a merged block the device rejected
+                for index in indices:
+                    results[index] = self.get_ram(*requests[index])
+                continue
+            for index in indices:
+                address, size = requests[index]
+                results[index] = data[address - start : address - start + size]
+        return results
+
     def put_ram(self, address: int, size: int, value: bytearray):
         """Write data to the microcontroller's RAM.
 
@@ -159,11 +245,39 @@ class LNet:
         Raises:
             RuntimeError: If device information is not retrieved before writing to RAM.
         """
-        self._check_device_info()
-        put_ram_frame = FramePutRam(address, size, self.device_info.uc_width, value)
+        put_ram_frame = self._get_put_ram_frame(address, size, value)
         put_ram_frame.received = self._read_data(put_ram_frame.serialize())
         return put_ram_frame.deserialize()
 
+    def _get_get_ram_frame(self, address: int, bytes_to_read: int, data_type: int) -> FrameGetRam:
+        """Return the reusable GetRam frame configured for the given request.
+
+        The frame is created once, after the device information is known, and reconfigured on every
+        call instead of allocating a new frame object for each RAM access.
+
+        Raises:
+            RuntimeError: If device information is not retrieved before reading RAM.
+        """
+        if self._get_ram_frame is None:
+            self._check_device_info()
+            self._get_ram_frame = FrameGetRam(address, bytes_to_read, data_type, self.device_info.uc_width)
+        else:
+            self._get_ram_frame.set_all(address, bytes_to_read, data_type)
+        return self._get_ram_frame
+
+    def _get_put_ram_frame(self, address: int, size: int, value: bytearray) -> FramePutRam:
+        """Return the reusable PutRam frame configured for the given request.
+
+        Raises:
+            RuntimeError: If device information is not retrieved before writing to RAM.
+        """
+        if self._put_ram_frame is None:
+            self._check_device_info()
+            self._put_ram_frame = FramePutRam(address, size, self.device_info.uc_width, value)
+        else:
+            self._put_ram_frame.set_all(address, size, value)
+        return self._put_ram_frame
+
     def _read_data(self, frame):
         """Send a frame to the microcontroller and read the response.
 
@@ -173,8 +287,7 @@ class LNet:
         Returns:
             The response from the microcontroller.
         """
-        self.interface.write(frame)
-        return self.interface.read()
+        return self.interface.transact(frame)
 
     def get_scope_setup(self) -> ScopeSetup:
         """Get the current scope setup.
@@ -1,6 +1,24 @@
 import logging
 from abc import ABC, abstractmethod
 
+logger = logging.getLogger(__name__)
+
+_ERROR_ID = {
+    0: "No Error",
+    19: "Checksum Error",
+    20: "Format Error",
+    21: "Size too large",
+    33: "Service not available",
+    34: "Invalid DSP state",
+    48: "Flash write error",
+    49: "Flash write protect error",
+    64: "Invalid Parameter ID",
+    65: "Invalid Block ID",
+    66: "Parameter Limit error",
+    67: "Parameter table not initialized",
+    80: "Power-on Error",
+}
+
 
 class LNetFrame(ABC):
     """LNetFrame is an abstract base class that implements the structure of LNet frames.
@@ -19,7 +37,7 @@ class LNetFrame(ABC):
         service_id (int): The Service ID identifying the type of service.
         __syn (int): The SYN byte value (always 0x55).
         __node (int): The NODE byte value (default is 1).
-        data (list): The data part of the frame.
+        data (bytearray): The data part of the frame.
         crc (int): The calculated CRC value for the frame.
 
     Methods:
@@ -59,6 +77,8 @@ class LNetFrame(ABC):
             Save the parameters and check for errors in the received frame.
     """
 
+    __slots__ = ("received", "service_id", "__syn", "__node", "data", "crc")
+
     def __init__(self):
         """Initialize an LNetFrame instance.
         """
@@ -66,7 +86,7 @@ class LNetFrame(ABC):
         self.service_id = None
         self.__syn = 85
         self.__node = 1
-        self.data = []  # data
+        self.data = bytearray()  # data
         self.crc = None
 
     @abstractmethod
@@ -87,26 +107,21 @@ class LNetFrame(ABC):
         """
         self.data.clear()  # clear the data array
         self._get_data()  # Get data from the subclass (actual service)
-        frame_size = len(self.data)  # Get the length of the data frame
-        self.data[:0] = [self.__syn, frame_size, self.__node]  # prepend frame bytes
-        self.data.append(self._crc_checksum(self.data))
-        self._add_fill_byte()
-        return bytearray(self.data)
+        frame = bytearray((self.__syn, len(self.data), self.__node))  # frame bytes
+        frame += self.data
+        frame.append(self._crc_checksum(frame))
+        return self._add_fill_byte(frame)
 
     def _crc_checksum(self, list_crc):
         """Calculate a checksum from the contents of a list.
 
         Args:
-            list_crc (list): List of integers to calculate the CRC from.
+            list_crc (list): List of integers (or bytes-like object) to calculate the CRC from.
 
         Returns:
             int: Calculated CRC.
         """
-        sum_of_frame_data = sum(list_crc)  # Summing the list (int)
-
-        crc_calculation = sum_of_frame_data % 256  # Calculate modulo
-
-        logging.debug("Checksum: {}".format(crc_calculation))
+        crc_calculation = sum(list_crc) & 0xFF  # sum of the frame bytes modulo 256
 
         # Checksum 0x55 == 0xAA   85 == 170
         # Checksum 0x02 == 0xFD   02 == 253 (INVERTED)
@@ -117,21 +132,25 @@ class LNetFrame(ABC):
 
         self.crc = crc_calculation  # Add the hex checksum to the list of the data
 
-        logging.debug("Calculated CRC for the frame: {}  Based on: {}".format(self.crc, list_crc))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Calculated CRC for the frame: %d  Based on: %s", self.crc, list_crc)
 
         return self.crc
 
-    def _add_fill_byte(self):
+    @staticmethod
+    def _add_fill_byte(frame: bytearray) -> bytearray:
         """Handle reserved key values 0x55 and 0x02 in SIZE, NODE, or DATA areas.
 
         If any of these key values occur within SIZE, NODE, or DATA area, a 0x00 'fill_bytes'
         will be added, which will not be counted as data size and not be used in checksum calculation.
+
+        Args:
+            frame (bytearray): The frame starting with the SYN byte.
+
+        Returns:
+            bytearray: The frame with fill bytes added.
         """
-        i = 1
-        while i < len(self.data):
-            if self.data[i] == 0x02 or self.data[i] == 0x55:
-                self.data.insert(i + 1, 0x00)
-            i += 1
+        return frame[:1] + frame[1:].replace(b"\x55", b"\x55\x00").replace(b"\x02", b"\x02\x00")
 
     def frame_integrity(self) -> bool:
         """Check the integrity of the received frame by verifying the CRC.
@@ -140,7 +159,7 @@ class LNetFrame(ABC):
             bool: True if the frame integrity check passes, False otherwise.
         """
         if self._crc_checksum(self.received[:-1]) != self.received[-1]:
-            logging.error("CRC Checksum doesn't match: {}".format(self._crc_checksum(self.received)))
+            logger.error("CRC Checksum doesn't match: calculated %d, received %d", self.crc, self.received[-1])
             return False
         return True
 
@@ -159,17 +178,15 @@ class LNetFrame(ABC):
         Returns:
             bool: True if the Service ID and error status are valid, False otherwise.
         """
-        logging.debug(self.get_error_id(self.received[4]))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(self.get_error_id(self.received[4]))
         return self.received[3] == self.service_id and self.received[4] == 0
 
     def _remove_fill_byte(self):
         """Remove fill bytes (0x00) from the received frame.
         """
-        z = 1
-        while z < len(self.received):
-            if self.received[z] == 0x55 or self.received[z] == 0x02:
-                self.received.pop(z + 1)
-            z += 1
+        received = self.received
+        self.received = received[:1] + received[1:].replace(b"\x55\x00", b"\x55").replace(b"\x02\x00", b"\x02")
 
     def deserialize(self):
         """Save the parameters and check for errors in the response frame.
@@ -181,7 +198,7 @@ class LNetFrame(ABC):
         if self.frame_integrity() and self._check_frame_protocol():
             return self._deserialize()
         else:
-            logging.error("Error on frame integrity or frame not correct!")
+            logger.error("Error on frame integrity or frame not correct!")
 
     @staticmethod
     def get_error_id(error_id: int):
@@ -193,28 +210,7 @@ class LNetFrame(ABC):
         Returns:
             str: Error description.
         """
-        _error_id = {
-            0: "No Error",
-            19: "Checksum Error",
-            20: "Format Error",
-            21: "Size too large",
-            33: "Service not available",
-            34: "Invalid DSP state",
-            48: "Flash write error",
-            49: "Flash write protect error",
-            64: "Invalid Parameter ID",
-            65: "Invalid Block ID",
-            66: "Parameter Limit error",
-            67: "Parameter table not initialized",
-            80: "Power-on Error",
-        }
-        try:
-            __error_id = _error_id[error_id]
-        except IndexError:
-            logging.error("Unknown Error")
-            logging.error("Valid index numbers are: " + str(list(_error_id.keys())))
-            return
-        return _error_id[error_id]
+        return _ERROR_ID.get(error_id, "Unknown Error")
 
 
 if __name__ == "__main__":
@@ -14,17 +14,50 @@ Usage:
 """
 
 import logging
+import struct
 from dataclasses import dataclass
 from typing import ClassVar
 
 from mchplnet.lnetframe import LNetFrame
 
+logger = logging.getLogger(__name__)
+
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+
+_PROCESSOR_IDS_16_BIT = {
+    0x8210: "__GENERIC_MICROCHIP_DSPIC__",
+    0x8230: "__GENERIC_MICROCHIP_PIC24__",
+    0x0221: "__DSPIC33FJ256MC710__",
+    0x0222: "__DSPIC33FJ128MC706__",
+    0x0223: "__DSPIC33FJ128MC506__",
+    0x0224: "__DSPIC33FJ64GS610__",
+    0x0225: "__DSPIC33FJ64GS406__",
+    0x0226: "__DSPIC33FJ12GP202__",
+    0x0228: "__DSPIC33FJ128MC802__",
+    0x0231: "__DSPIC33EP256MC506__",
+    0x0232: "__DSPIC33EP128GP502__",
+    0x0233: "__DSPIC33EP32GP502__",
+    0x0234: "__DSPIC33EP256GP502__",
+    0x0235: "__DSPIC33EP256MC502__",
+    0x0236: "__DSPIC33EP128MC202__",
+    0x0237: "__DSPIC33EP128GM604__",
+}
+
+_PROCESSOR_IDS_32_BIT = {
+    0x8240: "X2C_GENERIC_MICROCHIP_DSPIC33A",
+    0x8220: "__GENERIC_MICROCHIP_PIC32__",
+    0x8320: "__GENERIC_ARM_ARMV6__",
+    0x8310: "__GENERIC_ARM_ARMV7__",
+    0x0241: "__PIC32MZ2048EC__",
+    0x0251: "__PIC32MX170F256__",
+}
+
 
 @dataclass
 class DeviceInfo:
     monitor_version: int = 0
     appVer: int = 0
-    maxTargetSize = 0
     processor_id: int = 0
     monitorDate: int = 0
     monitorTime: int = 0
@@ -35,16 +68,34 @@ class DeviceInfo:
     eventType: int = 0
     eventID: int = 0
     tableStructAdd: int = 0
+    # declared last to keep the positional order of the fields above
+    maxTargetSize: int = 0
     MACHINE_16: ClassVar[int] = 2
     MACHINE_32: ClassVar[int] = 4
 
 
+# Processor name and microcontroller width by processor ID
+_PROCESSOR_IDS = {pid: (name, DeviceInfo.MACHINE_16) for pid, name in _PROCESSOR_IDS_16_BIT.items()}
+_PROCESSOR_IDS.update({pid: (name, DeviceInfo.MACHINE_32) for pid, name in _PROCESSOR_IDS_32_BIT.items()})
+
+
 # noinspection PyTypeChecker
 class FrameDeviceInfo(LNetFrame):
     """Custom frame for device information retrieval and interpretation.
     Inherits from LNetFrame.
     """
 
+    __slots__ = ()
+
+    _DSP_STATES = {
+        0x00: "Monitor runs on target but no application",
+        0x01: "Application runs on target",
+        0x02: "Application is idle",
+        0x03: "Application is initializing and usually changes to state 'IDLE' after being finished",
+        0x04: "POWER OFF",
+        0x05: "POWER ON",
+    }
+
     def __init__(self):
         """Initialize the FrameDeviceInfo class.
         """
@@ -58,66 +109,33 @@ class FrameDeviceInfo(LNetFrame):
         """Maps the microcontroller ID to the corresponding value.
 
         Returns:
-            int: Microcontroller width (2 for 16-bit uc or 4 for 32-bit uc) or None if not in the list of uc defined.
+            tuple: (name, width) with the processor name and the microcontroller width (2 for 16-bit uc or
+            4 for 32-bit uc), or (0, None) if the processor ID is unknown.
         """
-        value = int.from_bytes(self.received[10:12], byteorder="little")
-        hex_value = hex(value)
-
-        processor_ids_16_bit = {
-            "0x8210": "__GENERIC_MICROCHIP_DSPIC__",
-            "0x8230": "__GENERIC_MICROCHIP_PIC24__",
-            "0x0221": "__DSPIC33FJ256MC710__",
-            "0x0222": "__DSPIC33FJ128MC706__",
-            "0x0223": "__DSPIC33FJ128MC506__",
-            "0x0224": "__DSPIC33FJ64GS610__",
-            "0x0225": "__DSPIC33FJ64GS406__",
-            "0x0226": "__DSPIC33FJ12GP202__",
-            "0x0228": "__DSPIC33FJ128MC802__",
-            "0x0231": "__DSPIC33EP256MC506__",
-            "0x0232": "__DSPIC33EP128GP502__",
-            "0x0233": "__DSPIC33EP32GP502__",
-            "0x0234": "__DSPIC33EP256GP502__",
-            "0x0235": "__DSPIC33EP256MC502__",
-            "0x0236": "__DSPIC33EP128MC202__",
-            "0x0237": "__DSPIC33EP128GM604__",
-        }
-
-        processor_ids_32_bit = {
-            "0x8240": "X2C_GENERIC_MICROCHIP_DSPIC33A",
-            "0x8220": "__GENERIC_MICROCHIP_PIC32__",
-            "0x8320": "__GENERIC_ARM_ARMV6__",
-            "0x8310": "__GENERIC_ARM_ARMV7__",
-            "0x0241": "__PIC32MZ2048EC__",
-            "0x0251": "__PIC32MX170F256__",
-        }
-
-
-        if hex_value in processor_ids_16_bit:
-            logging.info(f"Processor is: {processor_ids_16_bit.get(hex_value)} :16-bit")
-            DeviceInfo.processor_id = processor_ids_16_bit.get(hex_value)
-            return 2
-        elif hex_value in processor_ids_32_bit:
-            logging.info(f"Processor is: {processor_ids_32_bit.get(hex_value)} :32-bit")
-            DeviceInfo.processor_id = processor_ids_32_bit.get(hex_value)
-            return 4
-        else:
-            logging.error("Processor is: Unknown")
-            return None
+        processor = _PROCESSOR_IDS.get(_U16.unpack_from(self.received, 10)[0])
+        if processor is None:
+            logger.error("Processor is: Unknown")
+            return 0, None
+        logger.info("Processor is: %s :%d-bit", processor[0], processor[1] * 8)
+        return processor
 
     def _deserialize(self):
-        DeviceInfo.appVer = self._app_ver()
-        DeviceInfo.monitor_version = self._monitor_ver()
-        DeviceInfo.uc_width = self._get_processor_id()
-        DeviceInfo.monitorDate = self._monitor_date()
-        DeviceInfo.monitorTime = self._monitor_time()
-        DeviceInfo.appDate = self._app_date()
-        DeviceInfo.appTime = self._app_time()
-        DeviceInfo.dsp_state = self._dsp_state()
-        DeviceInfo.eventType = self._event_type()
-        DeviceInfo.eventID = self._event_id()
-        DeviceInfo.tableStructAdd = self._table_struct_add()
-
-        return DeviceInfo
+        processor_id, uc_width = self._get_processor_id()
+        return DeviceInfo(
+            monitor_version=self._monitor_ver(),
+            appVer=self._app_ver(),
+            processor_id=processor_id,
+            monitorDate=self._monitor_date(),
+            monitorTime=self._monitor_time(),
+            appDate=self._app_date(),
+            appTime=self._app_time(),
+            uc_width=uc_width,
+            dsp_state=self._dsp_state(),
+            eventType=self._event_type(),
+            eventID=self._event_id(),
+            tableStructAdd=self._table_struct_add(),
+            maxTargetSize=self._max_target_size(),
+        )
 
     def _app_ver(self):
         """Get the application version.
@@ -125,7 +143,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             int: The application version data.
         """
-        return int.from_bytes(self.received[7:9], byteorder="little")
+        return _U16.unpack_from(self.received, 7)[0]
 
     def _monitor_ver(self):
         """Get the monitor version.
@@ -133,7 +151,15 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             int: The monitor version data.
         """
-        return int.from_bytes(self.received[5:7], byteorder="little")
+        return _U16.unpack_from(self.received, 5)[0]
+
+    def _max_target_size(self):
+        """Get the maximum DATA frame size supported by the target.
+
+        Returns:
+            int: The maximum target frame size.
+        """
+        return self.received[9]
 
     def _monitor_date(self):
         """Extract and convert monitor date and time from the received data.
@@ -141,7 +167,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             str: Monitor date and time as a string.
         """
-        return "".join([chr(val) for val in self.received[12:21]])
+        return self._decode_string(12, 21)
 
     def _monitor_time(self):
         """Extract and convert monitor date and time from the received data.
@@ -149,7 +175,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             str: Monitor date and time as a string.
         """
-        return "".join([chr(val) for val in self.received[21:25]])
+        return self._decode_string(21, 25)
 
     def _app_date(self):
         """Extract and convert monitor date from the received data.
@@ -157,7 +183,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             str: Monitor date as a string.
         """
-        return "".join([chr(val) for val in self.received[25:34]])
+        return self._decode_string(25, 34)
 
     def _app_time(self):
         """Extract and convert monitor time from the received data.
@@ -165,7 +191,19 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             str: Monitor time as a string.
         """
-        return "".join([chr(val) for val in self.received[34:38]])
+        return self._decode_string(34, 38)
+
+    def _decode_string(self, start: int, end: int) -> str:
+        """Decode a fixed size character field from the received data.
+
+        Args:
+            start (int): Index of the first character.
+            end (int): Index after the last character.
+
+        Returns:
+            str: The decoded characters, one per byte.
+        """
+        return self.received[start:end].decode("latin-1")
 
     def _dsp_state(self):
         """The DSP state indicates the current state of X2C.
@@ -178,15 +216,7 @@ class FrameDeviceInfo(LNetFrame):
             "APPLICATION RUNNING - POWER OFF - Application is running with disabled power electronics".
             "APPLICATION RUNNING - POWER ON - Application is running with enabled power electronics".
         """
-        dsp_state = {
-            0x00: "Monitor runs on target but no application",
-            0x01: "Application runs on target",
-            0x02: "Application is idle",
-            0x03: "Application is initializing and usually changes to state 'IDLE' after being finished",
-            0x04: "POWER OFF",
-            0x05: "POWER ON",
-        }
-        return dsp_state.get(self.received[38], "Unknown DSP State")
+        return self._DSP_STATES.get(self.received[38], "Unknown DSP State")
 
     def _event_type(self):
         """Get the monitor version.
@@ -194,7 +224,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             int: The monitor version.
         """
-        return int.from_bytes(self.received[39:41], byteorder="little")
+        return _U16.unpack_from(self.received, 39)[0]
 
     def _event_id(self):
         """Get the monitor version.
@@ -202,7 +232,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             int: The monitor version data.
         """
-        return int.from_bytes(self.received[41:45], byteorder="little")
+        return _U32.unpack_from(self.received, 41)[0]
 
     def _table_struct_add(self):
         """Get the table structure add.
@@ -210,7 +240,7 @@ class FrameDeviceInfo(LNetFrame):
         Returns:
             int: The table structure add.
         """
-        return int.from_bytes(self.received[45:49], byteorder="little")
+        return _U32.unpack_from(self.received, 45)[0]
 
 
 if __name__ == "__main__":
@@ -1,7 +1,24 @@
 """Implements the FrameGetRam functionality to read values from target memory address."""
 
+import struct
+from typing import Optional
+
 from mchplnet.lnetframe import LNetFrame
 
+# Little-endian unsigned layouts for the variable sizes supported by the microcontrollers
+_UNSIGNED_STRUCTS = {
+    1: struct.Struct("<B"),
+    2: struct.Struct("<H"),
+    4: struct.Struct("<I"),
+    8: struct.Struct("<Q"),
+}
+
+# Service ID, address, read size and data type, by microcontroller width
+_REQUEST_STRUCTS = {
+    2: struct.Struct("<BHBB"),
+    4: struct.Struct("<BIBB"),
+}
+
 
 class FrameGetRam(LNetFrame):
     """Class implementation for 'GetRam' frame in the LNet protocol.
@@ -9,6 +26,8 @@ class FrameGetRam(LNetFrame):
     This frame is responsible for setting up the request frame for the MCU to 'Get' the variable value.
     """
 
+    __slots__ = ("address", "read_size", "uc_width", "value_data_type")
+
     def __init__(self, address: int, read_size: int, data_type: int, uc_width: int):
         """Initialize the FrameGetRam instance.
 
@@ -27,8 +46,8 @@ class FrameGetRam(LNetFrame):
         self.value_data_type = data_type
 
     def _get_data(self):
-        byte_address = self.address.to_bytes(length=self.uc_width, byteorder="little")
-        self.data.extend([self.service_id, *byte_address, self.read_size, self.value_data_type])
+        request_struct = _REQUEST_STRUCTS[self.uc_width]
+        self.data += request_struct.pack(self.service_id, self.address, self.read_size, self.value_data_type)
 
     def _deserialize(self):
         # Extract the size of the received data
@@ -47,6 +66,32 @@ class FrameGetRam(LNetFrame):
         # Extract the data bytes
         return self.received[service_data_begin:service_data_end]
 
+    def deserialize_int(self) -> Optional[int]:
+        """Deserialize the received frame and unpack the variable value.
+
+        Returns:
+            Optional[int]: The variable value as little-endian unsigned integer or None if there are errors.
+        """
+        data = self.deserialize()
+        if data is None:
+            return None
+        value_struct = _UNSIGNED_STRUCTS.get(len(data))
+        if value_struct is None:
+            return int.from_bytes(data, byteorder="little")
+        return value_struct.unpack_from(data)[0]
+
+    def set_all(self, address: int, read_size: int, data_type: int) -> None:
+        """Set all parameters manually of the frame.
+
+        Args:
+            address (int): Address of the variable.
+            read_size (int): number of bytes to be read by the frame from microcontroller.
+            data_type (int): describes the type of the variable (1: 8-bit, 2:16-bit, 4:32-bit)
+        """
+        self.address = address
+        self.read_size = read_size
+        self.value_data_type = data_type
+
     def set_size(self, size: int):
         """Set the size of the variable for the LNET frame for GetRamBlock.
 
@@ -3,10 +3,15 @@ Usage: FrameLoadParameter is responsible for loading parameters, which are used
 and maximum size for once, as well as to check the current scope state.
 """
 
+import struct
 from dataclasses import dataclass
 
 from mchplnet.lnetframe import LNetFrame
 
+# Layout of the LoadScopeData fields, in declaration order, little-endian.
+# Only trigger_delay and trigger_event_position may be negative, all other fields are unsigned.
+_SCOPE_DATA = struct.Struct("<BBHIIiiIIB")
+
 
 @dataclass
 class LoadScopeData:
@@ -45,6 +50,8 @@ class FrameLoadParameter(LNetFrame):
     """Class responsible for loading parameters using the LNet protocol.
     """
 
+    __slots__ = ("address", "size", "unique_parameter")
+
     def __init__(self):
         """Initialize the FrameLoadParameter instance.
         """
@@ -53,34 +60,13 @@ class FrameLoadParameter(LNetFrame):
         self.size = None
         self.service_id = 17
         self.unique_parameter = 1
+        self.unique_parameter = self.unique_parameter.to_bytes(length=2, byteorder="little")
 
     def _deserialize(self):
-        data_bytes = self.received[5:-1]
-        data_structure = [
-            ("scope_state", 1),
-            ("num_channels", 1),
-            ("sample_time_factor", 2),
-            ("data_array_pointer", 4),
-            ("data_array_address", 4),
-            ("trigger_delay", 4),
-            ("trigger_event_position", 4),
-            ("data_array_used_length", 4),
-            ("data_array_size", 4),
-            ("scope_version", 1),
-        ]
-
-        extracted_data = {}
-        start_pos = 0
-        for field, size in data_structure:
-            extracted_data[field] = int.from_bytes(
-                data_bytes[start_pos : start_pos + size],
-                byteorder="little",
-                signed=True,
-            )
-            start_pos += size
-
-        return LoadScopeData(**extracted_data)
+        # older scope versions may send fewer bytes, missing fields are read as zero
+        data_bytes = self.received[5:-1].ljust(_SCOPE_DATA.size, b"\x00")
+        return LoadScopeData(*_SCOPE_DATA.unpack_from(data_bytes))
 
     def _get_data(self):
-        self.unique_parameter = self.unique_parameter.to_bytes(length=2, byteorder="little")
-        self.data.extend([self.service_id, *self.unique_parameter])
+        self.data.append(self.service_id)
+        self.data += self.unique_parameter
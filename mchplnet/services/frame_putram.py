@@ -2,13 +2,23 @@
 Description: This module writes user defined values to target memory address.
 """
 
+import struct
+
 from mchplnet.lnetframe import LNetFrame
 
+# Service ID, address and size, by microcontroller width
+_REQUEST_STRUCTS = {
+    2: struct.Struct("<BHB"),
+    4: struct.Struct("<BIB"),
+}
+
 
 class FramePutRam(LNetFrame):
     """FramePutRam is responsible for setting up the request frame for MCU to 'Set' the variable value.
     """
 
+    __slots__ = ("value_dataType", "address", "size", "value")
+
     def __init__(self, address: int, size: int, width: int, value: bytearray = None):
         """Initialize the FramePutRam instance.
 
@@ -26,8 +36,9 @@ class FramePutRam(LNetFrame):
         self.value = bytearray() if value is None else value
 
     def _get_data(self):
-        byte_address = self.address.to_bytes(length=self.value_dataType, byteorder="little")
-        self.data.extend([self.service_id, *byte_address, self.size, *self.value])
+        request_struct = _REQUEST_STRUCTS[self.value_dataType]
+        self.data += request_struct.pack(self.service_id, self.address, self.size)
+        self.data.extend(self.value)
 
     def set_all(self, address: int, size: int, value: bytearray) -> None:
         """Set all parameters manually of the frame.
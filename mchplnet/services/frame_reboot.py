@@ -6,6 +6,8 @@ class FrameReboot(LNetFrame):
     Inherits from LNetFrame.
     """
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the FrameDeviceInfo class.
         """
@@ -11,20 +11,21 @@ class FrameSaveParameter(LNetFrame):
         size: The size of the frame.
         service_id: The service ID of the frame.
         unique_ID: The unique ID of the frame.
-        scope_config: The scope configuration to be included in the frame.
+        scope_setup: The scope setup to be included in the frame.
 
     Methods:
         __init__(): Initialize the FrameSaveParameter object.
         _deserialize (received: bytearray) -> bytearray | None: Deserialize the frame data.
-        _get_data() -> list: Define the interface to get frame data.
-        set_scope_configuration(scope_config: ScopeConfiguration): Set the scope configuration.
-        remove_channel_by_name(channel_name: str): Remove a channel from the scope configuration by its name.
+        _get_data(): Define the interface to get frame data.
+        set_scope_setup(scope_setup: ScopeSetup): Set the scope setup.
     """
 
+    __slots__ = ("address", "size", "unique_ID", "scope_setup")
+
     def __init__(self):
         """Initialize a FrameSaveParameter object.
 
-        Initializes the address, size, service_id, unique_ID, and scope_config attributes.
+        Initializes the address, size, service_id, unique_ID, and scope_setup attributes.
         """
         super().__init__()
         self.address = None
@@ -42,8 +43,9 @@ class FrameSaveParameter(LNetFrame):
         """
 
     def _get_data(self):
-        self.data.extend([self.service_id, *self.unique_ID])
-        self.data.extend(self.scope_setup.get_buffer())
+        self.data.append(self.service_id)
+        self.data += self.unique_ID
+        self.data += self.scope_setup.get_buffer()
 
     def set_scope_setup(self, scope_setup: ScopeSetup):
         self.scope_setup = scope_setup
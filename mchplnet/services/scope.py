@@ -4,6 +4,20 @@ from dataclasses import dataclass
 from typing import Dict
 import struct
 
+# maximum number of channels supported by the scope
+_MAX_CHANNELS = 8
+
+# scope state, number of channels and sample time factor
+_SETUP_HEADER = struct.Struct("<BBH")
+# source type, source location and data type size of a channel or of the trigger source
+_CHANNEL = struct.Struct("<BIB")
+# trigger data type, source type and source location
+_TRIGGER_SOURCE = struct.Struct("<BBI")
+# integer trigger level keyed by the data type size of the trigger channel
+_TRIGGER_LEVEL_INT = {size: struct.Struct(fmt) for size, fmt in ((1, "<b"), (2, "<h"), (4, "<i"), (8, "<q"))}
+_TRIGGER_LEVEL_FLOAT = struct.Struct("<f")
+_TRIGGER_DELAY = struct.Struct("<i")
+
 @dataclass
 class ScopeChannel:
     """Represents a scope channel configuration.
@@ -95,7 +109,7 @@ class ScopeSetup:
             int: The total number of channels after addition or -1 if the limit is exceeded. Max allowed channels are 8.
         """
         if channel.name not in self.channels:
-            if len(self.channels) > 8:
+            if len(self.channels) >= _MAX_CHANNELS:
                 return -1
             self.channels[channel.name] = channel
         if trigger:
@@ -163,25 +177,24 @@ class ScopeSetup:
         """
         if self.scope_trigger.channel:
             if isinstance(self.scope_trigger.trigger_level, float):
-                # Convert float to bytes using struct
-                return struct.pack('<f', self.scope_trigger.trigger_level)
-            else:
-                # Assume it is an integer and use to_bytes
-                return self.scope_trigger.trigger_level.to_bytes(
-                    self.scope_trigger.channel.data_type_size,
-                    byteorder="little",
-                    signed=True,
-                )
+                return _TRIGGER_LEVEL_FLOAT.pack(self.scope_trigger.trigger_level)
+            size = self.scope_trigger.channel.data_type_size
+            if size in _TRIGGER_LEVEL_INT:
+                return _TRIGGER_LEVEL_INT[size].pack(self.scope_trigger.trigger_level)
+            # Assume it is an integer of a non standard width and use to_bytes
+            return self.scope_trigger.trigger_level.to_bytes(size, byteorder="little", signed=True)
         else:
             return bytes(2)
 
     def get_dataset_size(self):
-        """Calculate the size of the complete dataset from all channels.
+        """Calculate the size of the complete dataset from all enabled channels.
+
+        Disabled channels are not sent to the target, so they are not part of a dataset.
 
         Returns:
             int: The total size of the dataset.
         """
-        return sum(channel.data_type_size for channel in self.channels.values())
+        return sum(channel.data_type_size for channel in self.channels.values() if channel.is_enable)
 
     def _trigger_delay_to_bytes(self):
         """Convert user defined trigger delay to a byte array.
@@ -190,57 +203,46 @@ class ScopeSetup:
             bytearray: The trigger delay in byte format.
         """
         sample_number = self.scope_trigger.trigger_delay * self.get_dataset_size()
-        return sample_number.to_bytes(length=4, byteorder="little", signed=True)
+        return _TRIGGER_DELAY.pack(sample_number)
 
-    def get_buffer(self):
+    def get_buffer(self) -> bytearray:
         """Get the buffer containing the current scope configuration.
 
         Returns:
-            List[int]: A list consist of the scope configuration buffer.
+            bytearray: The scope configuration buffer.
         """
         if not self.channels:
-            return []
-        buffer = [
-            self.scope_state,
-            len(self.channels),
-            self.sample_time_factor & 0xFF,
-            (self.sample_time_factor >> 8) & 0xFF,
-        ]
-
-        for channel_name, channel in self.channels.items():
-            if not channel.is_enable:
-                continue
-            buffer.append(channel.source_type)
-            buffer.append(channel.source_location & 0xFF)
-            buffer.append((channel.source_location >> 8) & 0xFF)
-            buffer.append((channel.source_location >> 16) & 0xFF)
-            buffer.append((channel.source_location >> 24) & 0xFF)
-            buffer.append(channel.data_type_size)
-
-        buffer.extend(self._get_scope_trigger_buffer())  # add scope trigger
+            return bytearray()
+        # only enabled channels are sent, so the channel count must match them
+        channels = [channel for channel in self.channels.values() if channel.is_enable]
+        buffer = bytearray(_SETUP_HEADER.pack(self.scope_state, len(channels), self.sample_time_factor & 0xFFFF))
+
+        for channel in channels:
+            buffer += _CHANNEL.pack(channel.source_type, channel.source_location & 0xFFFFFFFF, channel.data_type_size)
+
+        buffer += self._get_scope_trigger_buffer()  # add scope trigger
         return buffer
 
-    def _get_scope_trigger_buffer(self):
+    def _get_scope_trigger_buffer(self) -> bytearray:
         """Get the buffer for the scope trigger configuration.
 
         Returns:
-            List[int]: A list consist of the scope trigger configuration buffer.
+            bytearray: The scope trigger configuration buffer.
         """
         if self.scope_trigger.channel:
-            buffer = [
-                self._get_trigger_data_type(),
-                self.scope_trigger.channel.source_type,
-                self.scope_trigger.channel.source_location & 0xFF,
-                (self.scope_trigger.channel.source_location >> 8) & 0xFF,
-                (self.scope_trigger.channel.source_location >> 16) & 0xFF,
-                (self.scope_trigger.channel.source_location >> 24) & 0xFF,
-            ]
+            buffer = bytearray(
+                _TRIGGER_SOURCE.pack(
+                    self._get_trigger_data_type(),
+                    self.scope_trigger.channel.source_type,
+                    self.scope_trigger.channel.source_location & 0xFFFFFFFF,
+                )
+            )
         else:
-            buffer = [self._get_trigger_data_type(), 0, 0, 0, 0, 0]
+            buffer = bytearray(_TRIGGER_SOURCE.pack(self._get_trigger_data_type(), 0, 0))
 
-        buffer.extend(self._trigger_level_to_bytes())
-        buffer.extend(self._trigger_delay_to_bytes())
-        buffer.extend([self.scope_trigger.trigger_edge, self.scope_trigger.trigger_mode])
+        buffer += self._trigger_level_to_bytes()
+        buffer += self._trigger_delay_to_bytes()
+        buffer += bytes((self.scope_trigger.trigger_edge, self.scope_trigger.trigger_mode))
         return buffer
 
     def _get_trigger_data_type(self):
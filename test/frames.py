@@ -0,0 +1,24 @@
+"""Helpers to build and inspect raw LNet frames in tests."""
+
+
+def crc(frame):
+    """Return the LNet checksum of a frame without fill bytes, with the reserved values remapped."""
+    checksum = sum(frame) & 0xFF
+    return {0x55: 0xAA, 0x02: 0xFD}.get(checksum, checksum)
+
+
+def add_fill_bytes(frame):
+    """Insert a 0x00 fill byte after every 0x55 and 0x02 following the SYN byte."""
+    return frame[:1] + frame[1:].replace(b"\x55", b"\x55\x00").replace(b"\x02", b"\x02\x00")
+
+
+def remove_fill_bytes(frame):
+    """Drop the 0x00 fill byte after every 0x55 and 0x02 following the SYN byte."""
+    return frame[:1] + frame[1:].replace(b"\x55\x00", b"\x55").replace(b"\x02\x00", b"\x02")
+
+
+def encode_frame(data):
+    """Build the frame sent on the wire for the given DATA bytes (service ID, error ID, service data)."""
+    frame = bytearray((0x55, len(data), 1)) + bytes(data)
+    frame.append(crc(frame))
+    return add_fill_bytes(frame)
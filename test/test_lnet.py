@@ -0,0 +1,104 @@
+"""Tests for LNet.get_ram_batch against a mock interface serving GetRam requests."""
+
+import unittest
+
+from mchplnet.interfaces.abstract_interface import InterfaceABC
+from mchplnet.lnet import LNet
+from mchplnet.services.frame_device_info import DeviceInfo
+
+from frames import encode_frame, remove_fill_bytes
+
+GET_RAM_SERVICE_ID = 9
+SIZE_TOO_LARGE = 0x15
+
+
+class MockInterface(InterfaceABC):
+    """Serve GetRam requests of a 32-bit target from a simulated RAM and record every request.
+
+    Requests for more than max_read_size bytes are answered with a "Size too large" error.
+    """
+
+    def __init__(self, error_id=0, max_read_size=253):
+        self.ram = bytes((i * 37 + 5) & 0xFF for i in range(0x1000))
+        self.error_id = error_id
+        self.max_read_size = max_read_size
+        self.requests = []
+        self.response = None
+
+    def start(self):
+        pass
+
+    def stop(self):
+        pass
+
+    def is_open(self):
+        return True
+
+    def write(self, data):
+        request = remove_fill_bytes(bytes(data))
+        address = int.from_bytes(request[4:8], "little")
+        size = request[8]
+        self.requests.append((address, size))
+        if self.error_id:
+            self.response = encode_frame((GET_RAM_SERVICE_ID, self.error_id))
+        elif size > self.max_read_size:
+            self.response = encode_frame((GET_RAM_SERVICE_ID, SIZE_TOO_LARGE))
+        else:
+            self.response = encode_frame((GET_RAM_SERVICE_ID, 0, *self.ram[address : address + size]))
+
+    def read(self):
+        return self.response
+
+
+class TestGetRamBatch(unittest.TestCase):
+    def setUp(self):
+        self.interface = MockInterface()
+        self.l_net = LNet(self.interface, handshake=False)
+        self.l_net.device_info = DeviceInfo(uc_width=DeviceInfo.MACHINE_32)
+
+    def expected(self, requests):
+        return [self.interface.ram[address : address + size] for address, size in requests]
+
+    def test_unsorted_overlapping_and_adjacent_requests(self):
+        requests = [(0x110, 2), (0x104, 4), (0x100, 4), (0x106, 2), (0x108, 4), (0x300, 1)]
+        result = self.l_net.get_ram_batch(requests)
+        self.assertEqual(self.expected(requests), result)
+        # 0x100..0x10C is contiguous, 0x110 and 0x300 are separated by gaps that must not be read
+        self.assertEqual([(0x100, 12), (0x110, 2), (0x300, 1)], self.interface.requests)
+
+    def test_block_size_is_capped(self):
+        requests = [(0x200, 200), (0x2C8, 53), (0x2FD, 1)]
+        result = self.l_net.get_ram_batch(requests)
+        self.assertEqual(self.expected(requests), result)
+        self.assertEqual([(0x200, 253), (0x2FD, 1)], self.interface.requests)
+
+    def test_block_size_follows_max_target_size(self):
+        # a maximum DATA size of 10 leaves 8 bytes for the RAM content next to service id and error id
+        self.interface.max_read_size = 8
+        self.l_net.device_info.maxTargetSize = 10
+        requests = [(0x100, 4), (0x104, 4), (0x108, 2), (0x10A, 4)]
+        result = self.l_net.get_ram_batch(requests)
+        self.assertEqual(self.expected(requests), result)
+        self.assertEqual([(0x100, 8), (0x108, 6)], self.interface.requests)
+
+    def test_rejected_block_falls_back_to_single_reads(self):
+        # the target does not report its maximum frame size but rejects blocks larger than 6 bytes
+        self.interface.max_read_size = 6
+        requests = [(0x104, 4), (0x100, 4), (0x200, 2), (0x202, 2)]
+        result = self.l_net.get_ram_batch(requests)
+        self.assertEqual(self.expected(requests), result)
+        self.assertEqual([(0x100, 8), (0x100, 4), (0x104, 4), (0x200, 4)], self.interface.requests)
+
+    def test_empty_request_list(self):
+        self.assertEqual([], self.l_net.get_ram_batch([]))
+        self.assertEqual([], self.interface.requests)
+
+    def test_error_response_yields_none(self):
+        self.interface.error_id = 21
+        result = self.l_net.get_ram_batch([(0x100, 2), (0x102, 2), (0x200, 4)])
+        self.assertEqual([None, None, None], result)
+        self.assertIsNone(self.l_net.get_ram(0x100, 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
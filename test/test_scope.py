@@ -0,0 +1,70 @@
+"""Tests for the scope setup configuration and its serialized buffer."""
+
+import struct
+import unittest
+
+from mchplnet.services.scope import ScopeChannel, ScopeSetup
+
+HEADER_SIZE = 4
+CHANNEL_SIZE = 6
+TRIGGER_SOURCE_SIZE = 6
+
+
+class TestScopeSetupChannels(unittest.TestCase):
+    def test_add_channel_is_limited_to_eight_channels(self):
+        scope_setup = ScopeSetup()
+        for index in range(8):
+            self.assertEqual(index + 1, scope_setup.add_channel(ScopeChannel(f"ch{index}", 0x1000 + 2 * index, 2)))
+        self.assertEqual(-1, scope_setup.add_channel(ScopeChannel("ch8", 0x1010, 2)))
+        self.assertEqual(8, len(scope_setup.list_channels()))
+        self.assertNotIn("ch8", scope_setup.list_channels())
+
+    def test_existing_channel_does_not_count_against_the_limit(self):
+        scope_setup = ScopeSetup()
+        channels = [ScopeChannel(f"ch{index}", 0x1000 + 2 * index, 2) for index in range(8)]
+        for channel in channels:
+            scope_setup.add_channel(channel)
+        self.assertEqual(8, scope_setup.add_channel(channels[0], trigger=True))
+        self.assertIs(channels[0], scope_setup.scope_trigger.channel)
+
+
+class TestScopeSetupBuffer(unittest.TestCase):
+    def setUp(self):
+        self.scope_setup = ScopeSetup()
+        self.scope_setup.add_channel(ScopeChannel("a", 0x20001000, 2), trigger=True)
+        self.scope_setup.add_channel(ScopeChannel("b", 0x20002000, 4, is_enable=False))
+        self.scope_setup.add_channel(ScopeChannel("c", 0x20003000, 1))
+        self.scope_setup.scope_trigger.trigger_level = -300
+        self.scope_setup.scope_trigger.trigger_delay = 3
+
+    def test_disabled_channel_is_left_out(self):
+        buffer = self.scope_setup.get_buffer()
+        # header count and descriptors only cover the enabled channels a and c
+        self.assertEqual(2, buffer[1])
+        descriptors = [
+            struct.unpack_from("<BIB", buffer, HEADER_SIZE + index * CHANNEL_SIZE) for index in range(buffer[1])
+        ]
+        self.assertEqual([(0, 0x20001000, 2), (0, 0x20003000, 1)], descriptors)
+        # trigger source, 2 byte trigger level, 4 byte trigger delay, edge and mode follow the descriptors
+        trigger_offset = HEADER_SIZE + 2 * CHANNEL_SIZE
+        self.assertEqual(trigger_offset + TRIGGER_SOURCE_SIZE + 2 + 4 + 2, len(buffer))
+        self.assertEqual((0x20001000,), struct.unpack_from("<I", buffer, trigger_offset + 2))
+        self.assertEqual((-300,), struct.unpack_from("<h", buffer, trigger_offset + TRIGGER_SOURCE_SIZE))
+
+    def test_trigger_delay_uses_enabled_dataset_size(self):
+        self.assertEqual(3, self.scope_setup.get_dataset_size())
+        buffer = self.scope_setup.get_buffer()
+        delay_offset = HEADER_SIZE + 2 * CHANNEL_SIZE + TRIGGER_SOURCE_SIZE + 2
+        self.assertEqual((3 * 3,), struct.unpack_from("<i", buffer, delay_offset))
+
+    def test_enabling_a_channel_updates_the_buffer(self):
+        self.scope_setup.get_channel("b").is_enable = True
+        buffer = self.scope_setup.get_buffer()
+        self.assertEqual(3, buffer[1])
+        self.assertEqual(7, self.scope_setup.get_dataset_size())
+        delay_offset = HEADER_SIZE + 3 * CHANNEL_SIZE + TRIGGER_SOURCE_SIZE + 2
+        self.assertEqual((3 * 7,), struct.unpack_from("<i", buffer, delay_offset))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,78 @@
+"""Tests for the frame reading of LNetSerial against a fake serial port returning short chunks."""
+
+import unittest
+
+from mchplnet.interfaces.uart import LNetSerial
+
+from frames import encode_frame
+
+
+class FakeSerial:
+    """Serve a byte stream in chunks of at most chunk_size bytes and return nothing once it is exhausted."""
+
+    def __init__(self, stream, chunk_size=1):
+        self.stream = bytearray(stream)
+        self.chunk_size = chunk_size
+        self.is_open = True
+
+    def read(self, size=1):
+        chunk = bytes(self.stream[: min(size, self.chunk_size)])
+        del self.stream[: len(chunk)]
+        return chunk
+
+    def write(self, data):
+        pass
+
+    def reset_input_buffer(self):
+        pass
+
+    def close(self):
+        self.is_open = False
+
+
+def _serial_interface(stream, chunk_size=1):
+    interface = LNetSerial(port=None)
+    interface.serial = FakeSerial(stream, chunk_size)
+    return interface
+
+
+class TestLNetSerialRead(unittest.TestCase):
+    def assert_reads_frame(self, frame, chunk_sizes=None):
+        for chunk_size in chunk_sizes or range(1, len(frame) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                self.assertEqual(frame, _serial_interface(frame, chunk_size).read())
+
+    def test_frame_without_fill_bytes(self):
+        self.assert_reads_frame(encode_frame((9, 0, 0x10, 0x20, 0x30, 0x40)))
+
+    def test_fill_bytes_split_across_chunks(self):
+        # all chunk sizes are tried, so fill bytes also arrive in another chunk than their reserved value
+        frame = encode_frame((9, 0, 0x55, 0x02, 0x55, 0x55, 0x02, 0x00, 0x02, 0x12))
+        self.assert_reads_frame(frame)
+
+    def test_size_byte_is_reserved_value(self):
+        # a SIZE of 0x02 or 0x55 is itself followed by a fill byte before NODE
+        for data in ((10, 0), (9, 0, *range(0x53))):
+            frame = encode_frame(data)
+            self.assertEqual(0x00, frame[2])
+            self.assert_reads_frame(frame, chunk_sizes=(1, 2, 3, 4, len(frame)))
+
+    def test_next_frame_is_not_consumed(self):
+        first = encode_frame((9, 0, 0x55, 0x01))
+        second = encode_frame((10, 0))
+        for chunk_size in (1, 2, 3, len(first), len(first) + len(second)):
+            with self.subTest(chunk_size=chunk_size):
+                interface = _serial_interface(first + second, chunk_size)
+                self.assertEqual(first, interface.read())
+                self.assertEqual(second, interface.serial.stream)
+                self.assertEqual(second, interface.read())
+
+    def test_timeout_returns_partial_frame(self):
+        frame = encode_frame((9, 0, 0x55, 0x02, 0x11, 0x22))
+        for length in (0, 1, 2, 4, len(frame) - 1):
+            with self.subTest(length=length):
+                self.assertEqual(frame[:length], _serial_interface(frame[:length], 2).read())
+
+
+if __name__ == "__main__":
+    unittest.main()